@@ -1,24 +1,22 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import hashlib
+import importlib.util
+import os
+import re
+import tempfile
 import warnings
-warnings.filterwarnings('ignore')
+warnings.filterwarnings('ignore', category=FutureWarning, module='pandas')
 
-# Try to import advanced NLP components (optional)
-try:
-    import nltk
-    from nltk.corpus import stopwords
-    from nltk.tokenize import word_tokenize
-    from nltk.util import ngrams
-    from collections import Counter
-    NLTK_AVAILABLE = True
-except ImportError:
-    NLTK_AVAILABLE = False
+# Optional components are only looked up here, not imported, to keep startup fast.
+# Advanced NLP (NLTK) should be imported by the code path that needs it.
+NLTK_AVAILABLE = importlib.util.find_spec('nltk') is not None
+
+# PyArrow gives pandas a multi-threaded CSV parser
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
 
 # Page configuration
 st.set_page_config(
@@ -76,12 +74,91 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Theme keywords for review analysis
+POSITIVE_THEMES = {
+    'Staff Service': ['crew', 'staff', 'service', 'friendly', 'helpful', 'professional'],
+    'Comfort': ['comfortable', 'seat', 'legroom', 'spacious', 'clean'],
+    'Food & Beverage': ['food', 'meal', 'drink', 'beverage', 'delicious', 'tasty'],
+    'Efficiency': ['on time', 'punctual', 'quick', 'fast', 'efficient'],
+    'Value': ['value', 'price', 'cheap', 'reasonable', 'worth'],
+    'Entertainment': ['entertainment', 'movie', 'tv', 'screen', 'wifi'],
+    'Airport Experience': ['check-in', 'boarding', 'airport', 'lounge', 'gate']
+}
+
+NEGATIVE_THEMES = {
+    'Poor Service': ['poor service', 'rude', 'unprofessional', 'slow service', 'bad service'],
+    'Delays': ['delay', 'late', 'cancelled', 'postponed', 'waiting'],
+    'Discomfort': ['uncomfortable', 'cramped', 'dirty', 'broken', 'small seat'],
+    'Food Issues': ['bad food', 'poor meal', 'no food', 'terrible food', 'cold food'],
+    'Booking Problems': ['booking', 'reservation', 'website', 'customer service'],
+    'Baggage Issues': ['baggage', 'luggage', 'lost', 'damaged', 'extra charge'],
+    'Communication': ['information', 'communication', 'announcement', 'language barrier']
+}
+
+# Compiled once at import so reruns don't rebuild the keyword alternations
+_POSITIVE_PATTERNS = {theme: re.compile('|'.join(map(re.escape, keywords)))
+                      for theme, keywords in POSITIVE_THEMES.items()}
+_NEGATIVE_PATTERNS = {theme: re.compile('|'.join(map(re.escape, keywords)))
+                      for theme, keywords in NEGATIVE_THEMES.items()}
+
+# Columns the dashboard reads from the review CSV, and a Parquet copy for fast reloads
+DATA_FILE = 'Airline Review.csv'
+PARQUET_CACHE = 'airline_review.parquet'
+DATA_COLUMNS = ['Airline Name', 'Overall_Rating', 'Review', 'Type Of Traveller', 'Seat Type', 'Route',
+                'Seat Comfort', 'Cabin Staff Service', 'Food & Beverages', 'Ground Service',
+                'Inflight Entertainment', 'Wifi & Connectivity', 'Value For Money', 'Recommended']
+
+def _read_review_data():
+    """Read the dashboard columns, preferring an up-to-date Parquet copy of the CSV"""
+    if os.path.exists(PARQUET_CACHE) and os.path.getmtime(PARQUET_CACHE) >= os.path.getmtime(DATA_FILE):
+        try:
+            cached = pd.read_parquet(PARQUET_CACHE)
+        except (ImportError, OSError, ValueError):
+            # An unreadable or truncated copy is just a cache miss; rebuild it from the CSV
+            cached = None
+        # A copy written before DATA_COLUMNS changed is stale even if it is newer than the CSV
+        if cached is not None and set(DATA_COLUMNS).issubset(cached.columns):
+            return cached
+    
+    # The CSV's unnamed index column is labelled differently by each parser engine
+    engine, index_column = ('pyarrow', '') if PYARROW_AVAILABLE else ('c', 'Unnamed: 0')
+    df = pd.read_csv(DATA_FILE, index_col=0, usecols=[index_column] + DATA_COLUMNS, engine=engine,
+                     dtype={'Airline Name': 'category', 'Seat Type': 'category',
+                            'Type Of Traveller': 'category', 'Recommended': 'category'})
+    _write_parquet_cache(df)
+    return df
+
+def _write_parquet_cache(df):
+    """Save the Parquet copy via a temp file so no reader ever sees a partial write"""
+    tmp_path = None
+    try:
+        # Same directory as the cache, so os.replace is an atomic rename
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(PARQUET_CACHE)),
+                                        suffix='.parquet.tmp')
+        os.close(fd)
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, PARQUET_CACHE)
+    except (ImportError, OSError):
+        # Parquet support (pyarrow/fastparquet) is optional; keep using the CSV
+        pass
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _frame_fingerprint(df):
+    """Cheap cache key for frames sliced from the cached dataset"""
+    # Filtered frames are row subsets of the same loaded data, so the row labels
+    # and column set identify them without hashing every cell
+    return hashlib.md5(np.ascontiguousarray(df.index.values).tobytes()).hexdigest(), tuple(df.columns)
+
+_FRAME_HASH_FUNCS = {pd.DataFrame: _frame_fingerprint}
+
 @st.cache_data
 def load_and_process_data():
     """Load and process the airline review data"""
     try:
         # Load the main dataset
-        df = pd.read_csv('Airline Review.csv', index_col=0)
+        df = _read_review_data()
         
         # Fix data type issues
         # Convert Overall_Rating to numeric, handle 'n' values
@@ -95,54 +172,36 @@ def load_and_process_data():
                        'Ground Service', 'Inflight Entertainment', 'Wifi & Connectivity', 
                        'Value For Money']
         
+        # Ratings are 1-5 stars, so nullable Int8 holds them in an eighth of the space
         for col in service_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int8')
         
-        # Parse routes into origin, destination, via
-        def parse_route(route_str):
-            if pd.isna(route_str):
-                return None, None, None
-            
-            route_str = str(route_str).strip()
-            
-            if " via " in route_str.lower():
-                main_route, via_part = route_str.split(" via ", 1)
-                via_city = via_part.strip()
-                
-                if " to " in main_route.lower():
-                    origin, destination = main_route.split(" to ", 1)
-                    return origin.strip(), destination.strip(), via_city
-                else:
-                    return route_str, None, None
-            
-            elif " to " in route_str.lower():
-                parts = route_str.split(" to ", 1)
-                if len(parts) == 2:
-                    return parts[0].strip(), parts[1].strip(), None
-                else:
-                    return route_str, None, None
-            else:
-                return route_str, None, None
-        
-        # Apply route parsing
-        route_data = df['Route'].apply(parse_route)
-        df['Origin'] = [x[0] for x in route_data]
-        df['Destination'] = [x[1] for x in route_data]
-        df['Via'] = [x[2] for x in route_data]
-        
-        # Create satisfaction segments
-        def categorize_satisfaction(rating):
-            if rating >= 8:
-                return 'Happy (8-10)'
-            elif rating >= 6:
-                return 'Neutral (6-7)'
-            elif rating >= 3:
-                return 'Disappointed (3-5)'
-            else:
-                return 'Very Disappointed (1-2)'
-        
-        df['Satisfaction_Segment'] = df['Overall_Rating'].apply(categorize_satisfaction)
+        # Parse routes into origin, destination, via (vectorized string splits)
+        routes = df['Route'].astype('string').str.strip()
+        route_parts = routes.str.split(r'\s+via\s+', n=1, regex=True, expand=True).reindex(columns=[0, 1])
+        origin_dest = route_parts[0].str.split(r'\s+to\s+', n=1, regex=True, expand=True).reindex(columns=[0, 1])
+
+        # Routes without an "origin to destination" part keep the raw route as origin
+        has_destination = origin_dest[1].notna()
+        df['Origin'] = origin_dest[0].str.strip().where(has_destination, routes)
+        df['Destination'] = origin_dest[1].str.strip()
+        df['Via'] = route_parts[1].str.strip().where(has_destination)
+        
+        # Store low-cardinality grouping/filter columns as categoricals
+        for col in ['Airline Name', 'Seat Type', 'Type Of Traveller', 'Recommended',
+                    'Origin', 'Destination', 'Via']:
+            df[col] = df[col].astype('category')
+        
+        # Integer recommendation flag, computed once and reused by every section
+        df['Recommended_Flag'] = df['Recommended'].str.lower().eq('yes').astype('int8')
+        
+        # Create satisfaction segments (<3, 3-5, 6-7, 8+)
+        df['Satisfaction_Segment'] = pd.cut(
+            df['Overall_Rating'],
+            bins=[-np.inf, 3, 6, 8, np.inf],
+            labels=['Very Disappointed (1-2)', 'Disappointed (3-5)', 'Neutral (6-7)', 'Happy (8-10)'],
+            right=False
+        )
         
         # Add review length
         df['Review_Length'] = df['Review'].fillna('').astype(str).str.len()
@@ -155,6 +214,7 @@ def load_and_process_data():
         st.error(f"Detailed error: {traceback.format_exc()}")
         return None, None
 
+@st.cache_data(hash_funcs=_FRAME_HASH_FUNCS, show_spinner=False)
 def extract_review_themes(df, sentiment='positive'):
     """Extract themes from reviews using simple keyword analysis"""
     try:
@@ -164,40 +224,20 @@ def extract_review_themes(df, sentiment='positive'):
             df = df.dropna(subset=['Overall_Rating'])
         
         if sentiment == 'positive':
-            reviews = df[df['Overall_Rating'] >= 8]['Review'].fillna('')
+            selected = df['Overall_Rating'] >= 8
         else:
-            reviews = df[df['Overall_Rating'] <= 3]['Review'].fillna('')
-    
-        # Combine all reviews
-        all_text = ' '.join(reviews.astype(str)).lower()
-        
-        # Define theme keywords
-        positive_themes = {
-            'Staff Service': ['crew', 'staff', 'service', 'friendly', 'helpful', 'professional'],
-            'Comfort': ['comfortable', 'seat', 'legroom', 'spacious', 'clean'],
-            'Food & Beverage': ['food', 'meal', 'drink', 'beverage', 'delicious', 'tasty'],
-            'Efficiency': ['on time', 'punctual', 'quick', 'fast', 'efficient'],
-            'Value': ['value', 'price', 'cheap', 'reasonable', 'worth'],
-            'Entertainment': ['entertainment', 'movie', 'tv', 'screen', 'wifi'],
-            'Airport Experience': ['check-in', 'boarding', 'airport', 'lounge', 'gate']
-        }
-        
-        negative_themes = {
-            'Poor Service': ['poor service', 'rude', 'unprofessional', 'slow service', 'bad service'],
-            'Delays': ['delay', 'late', 'cancelled', 'postponed', 'waiting'],
-            'Discomfort': ['uncomfortable', 'cramped', 'dirty', 'broken', 'small seat'],
-            'Food Issues': ['bad food', 'poor meal', 'no food', 'terrible food', 'cold food'],
-            'Booking Problems': ['booking', 'reservation', 'website', 'customer service'],
-            'Baggage Issues': ['baggage', 'luggage', 'lost', 'damaged', 'extra charge'],
-            'Communication': ['information', 'communication', 'announcement', 'language barrier']
-        }
-        
-        themes = positive_themes if sentiment == 'positive' else negative_themes
+            selected = df['Overall_Rating'] <= 3
+    
+        # Take just the review column and lowercase it per row; missing reviews
+        # stay NaN and drop out of the count sums
+        reviews = df.loc[selected, 'Review'].str.lower()
+        
+        patterns = _POSITIVE_PATTERNS if sentiment == 'positive' else _NEGATIVE_PATTERNS
         theme_counts = {}
         
-        for theme, keywords in themes.items():
-            count = sum(all_text.count(keyword) for keyword in keywords)
-            theme_counts[theme] = count
+        # One regex pass per theme over the column instead of one scan per keyword
+        for theme, pattern in patterns.items():
+            theme_counts[theme] = int(reviews.str.count(pattern).sum())
         
         return sorted(theme_counts.items(), key=lambda x: x[1], reverse=True)
         
@@ -205,6 +245,19 @@ def extract_review_themes(df, sentiment='positive'):
         st.error(f"Error in theme extraction: {e}")
         return []
 
+@st.cache_data(hash_funcs=_FRAME_HASH_FUNCS, show_spinner=False)
+def _headline_metrics(df, service_cols):
+    """Headline KPIs shared by the sidebar summary and the overview section"""
+    ratings = df['Overall_Rating'].values
+    return {
+        'avg_satisfaction': ratings.mean(),
+        'happy_rate': (ratings >= 8).mean() * 100,
+        'recommendation_rate': df['Recommended_Flag'].values.mean() * 100,
+        # Int8 means come back as nullable Float64; plain floats keep an empty slice as nan, not <NA>
+        'service_quality': df[service_cols].mean().astype(float).mean(),
+        'total_reviews': len(df)
+    }
+
 def create_satisfaction_overview(df, service_cols):
     """Create satisfaction overview metrics and charts"""
     st.markdown('<div class="section-header">📊 Flight Experience Satisfaction Overview</div>', unsafe_allow_html=True)
@@ -215,37 +268,35 @@ def create_satisfaction_overview(df, service_cols):
         df = df.dropna(subset=['Overall_Rating'])
     
     # Key metrics
+    metrics = _headline_metrics(df, service_cols)
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        avg_satisfaction = df['Overall_Rating'].mean()
+        avg_satisfaction = metrics['avg_satisfaction']
         st.metric("Average Satisfaction", f"{avg_satisfaction:.2f}/10", 
                  delta=f"{(avg_satisfaction-5):.1f} vs neutral")
         
     with col2:
-        happy_rate = (df['Overall_Rating'] >= 8).mean() * 100
-        st.metric("Happy Customers", f"{happy_rate:.1f}%")
+        st.metric("Happy Customers", f"{metrics['happy_rate']:.1f}%")
         
     with col3:
-        recommendation_rate = (df['Recommended'] == 'yes').mean() * 100
-        st.metric("Recommendation Rate", f"{recommendation_rate:.1f}%")
+        st.metric("Recommendation Rate", f"{metrics['recommendation_rate']:.1f}%")
         
     with col4:
-        service_quality = df[service_cols].mean().mean()
-        st.metric("Service Quality", f"{service_quality:.2f}/5")
+        st.metric("Service Quality", f"{metrics['service_quality']:.2f}/5")
         
     with col5:
-        total_reviews = len(df)
-        st.metric("Total Reviews", f"{total_reviews:,}")
+        st.metric("Total Reviews", f"{metrics['total_reviews']:,}")
     
     # Satisfaction distribution and trends
     col1, col2 = st.columns(2)
     
     with col1:
-        fig = px.histogram(df, x='Overall_Rating', nbins=10, 
-                          title="Overall Rating Distribution",
-                          color_discrete_sequence=['#1f77b4'])
-        fig.update_layout(showlegend=False, height=350)
+        # Bin on the server so only the 10 bar heights are sent to the browser
+        counts, edges = np.histogram(df['Overall_Rating'].values, bins=10, range=(0.5, 10.5))
+        fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, marker_color='#1f77b4'))
+        fig.update_layout(title="Overall Rating Distribution", xaxis_title="Overall_Rating",
+                         yaxis_title="count", bargap=0, showlegend=False, height=350)
         st.plotly_chart(fig, use_container_width=True)
         
     with col2:
@@ -260,13 +311,10 @@ def analyze_happiness_drivers(df, service_cols):
     """Analyze what makes passengers happiest or most frustrated"""
     st.markdown('<div class="section-header">😊 What Makes Passengers Happy vs Frustrated</div>', unsafe_allow_html=True)
     
-    # Service correlation analysis
-    correlations = []
-    for col in service_cols:
-        corr = df[col].corr(df['Overall_Rating'])
-        correlations.append({'Service': col, 'Correlation': corr})
-    
-    corr_df = pd.DataFrame(correlations).sort_values('Correlation', ascending=False)
+    # Service correlation analysis (one pairwise correlation matrix)
+    correlations = df[service_cols + ['Overall_Rating']].corr()['Overall_Rating'].drop('Overall_Rating')
+    corr_df = (correlations.rename_axis('Service').reset_index(name='Correlation')
+               .sort_values('Correlation', ascending=False))
     
     col1, col2 = st.columns(2)
     
@@ -285,12 +333,13 @@ def analyze_happiness_drivers(df, service_cols):
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
-        # Compare happy vs frustrated passengers
-        happy_passengers = df[df['Overall_Rating'] >= 8]
-        frustrated_passengers = df[df['Overall_Rating'] <= 3]
+        # Compare happy vs frustrated passengers in a single groupby pass
+        ratings = df['Overall_Rating'].values
+        rating_group = np.where(ratings >= 8, 'happy', np.where(ratings <= 3, 'frustrated', 'other'))
+        group_means = df.groupby(rating_group)[service_cols].mean().reindex(['happy', 'frustrated']).astype(float)
         
-        happy_means = happy_passengers[service_cols].mean()
-        frustrated_means = frustrated_passengers[service_cols].mean()
+        happy_means = group_means.loc['happy']
+        frustrated_means = group_means.loc['frustrated']
         
         comparison_df = pd.DataFrame({
             'Happy Passengers': happy_means,
@@ -367,7 +416,7 @@ def analyze_review_themes_advanced(df):
     
     with col1:
         # Review length by satisfaction
-        review_stats = df.groupby('Satisfaction_Segment').agg({
+        review_stats = df.groupby('Satisfaction_Segment', observed=True).agg({
             'Review_Length': ['mean', 'count'],
             'Overall_Rating': 'mean'
         }).round(2)
@@ -382,9 +431,7 @@ def analyze_review_themes_advanced(df):
         
     with col2:
         # Recommendation patterns
-        rec_by_segment = df.groupby('Satisfaction_Segment').apply(
-            lambda x: (x['Recommended'] == 'yes').mean() * 100
-        )
+        rec_by_segment = df.groupby('Satisfaction_Segment', observed=True)['Recommended_Flag'].mean() * 100
         
         fig = px.bar(x=rec_by_segment.index, y=rec_by_segment.values,
                     title="Recommendation Rate by Satisfaction Segment",
@@ -393,18 +440,23 @@ def analyze_review_themes_advanced(df):
                          yaxis_title="Recommendation Rate (%)")
         st.plotly_chart(fig, use_container_width=True)
 
+@st.cache_data(hash_funcs=_FRAME_HASH_FUNCS, show_spinner=False)
+def _airline_metrics(df):
+    """Per-airline rating and recommendation metrics (airlines with 10+ reviews)"""
+    airline_metrics = df.groupby('Airline Name', observed=True).agg(
+        Avg_Rating=('Overall_Rating', 'mean'),
+        Review_Count=('Overall_Rating', 'count'),
+        Recommendation_Rate=('Recommended_Flag', 'mean')
+    ).assign(Recommendation_Rate=lambda d: d['Recommendation_Rate'] * 100).round(2)
+    airline_metrics = airline_metrics[airline_metrics['Review_Count'] >= 10]
+    return airline_metrics.sort_values('Avg_Rating', ascending=False)
+
 def analyze_competitive_landscape(df):
     """Comprehensive competitive analysis"""
     st.markdown('<div class="section-header">🏆 Competitive Landscape Analysis</div>', unsafe_allow_html=True)
     
     # Airline performance metrics
-    airline_metrics = df.groupby('Airline Name').agg({
-        'Overall_Rating': ['mean', 'count'],
-        'Recommended': lambda x: (x == 'yes').mean() * 100
-    }).round(2)
-    airline_metrics.columns = ['Avg_Rating', 'Review_Count', 'Recommendation_Rate']
-    airline_metrics = airline_metrics[airline_metrics['Review_Count'] >= 10]
-    airline_metrics = airline_metrics.sort_values('Avg_Rating', ascending=False)
+    airline_metrics = _airline_metrics(df)
     
     # Performance quadrant analysis
     col1, col2 = st.columns(2)
@@ -457,18 +509,23 @@ def analyze_competitive_landscape(df):
         st.write(f"• Clear differentiation opportunities exist")
         st.markdown('</div>', unsafe_allow_html=True)
 
+@st.cache_data(hash_funcs=_FRAME_HASH_FUNCS, show_spinner=False)
+def _route_metrics(df):
+    """Per-route rating and recommendation metrics (routes with 5+ reviews)"""
+    route_performance = df.groupby('Route', observed=True).agg(
+        Avg_Rating=('Overall_Rating', 'mean'),
+        Review_Count=('Overall_Rating', 'count'),
+        Recommendation_Rate=('Recommended_Flag', 'mean')
+    ).assign(Recommendation_Rate=lambda d: d['Recommendation_Rate'] * 100).round(2)
+    route_performance = route_performance[route_performance['Review_Count'] >= 5]
+    return route_performance.sort_values('Avg_Rating', ascending=False)
+
 def analyze_geographic_performance(df):
     """Enhanced geographic and route analysis"""
     st.markdown('<div class="section-header">🌍 Geographic Performance & Route Analysis</div>', unsafe_allow_html=True)
     
     # Route performance analysis
-    route_performance = df.groupby('Route').agg({
-        'Overall_Rating': ['mean', 'count'],
-        'Recommended': lambda x: (x == 'yes').mean() * 100
-    }).round(2)
-    route_performance.columns = ['Avg_Rating', 'Review_Count', 'Recommendation_Rate']
-    route_performance = route_performance[route_performance['Review_Count'] >= 5]
-    route_performance = route_performance.sort_values('Avg_Rating', ascending=False)
+    route_performance = _route_metrics(df)
     
     col1, col2 = st.columns(2)
     
@@ -495,7 +552,7 @@ def analyze_geographic_performance(df):
     
     with col1:
         # Origin performance
-        origin_performance = df.groupby('Origin')['Overall_Rating'].agg(['mean', 'count'])
+        origin_performance = df.groupby('Origin', observed=True)['Overall_Rating'].agg(['mean', 'count'])
         origin_performance = origin_performance[origin_performance['count'] >= 10]
         origin_performance = origin_performance.sort_values('mean', ascending=False).head(10)
         
@@ -507,7 +564,7 @@ def analyze_geographic_performance(df):
         
     with col2:
         # Destination performance
-        dest_performance = df.groupby('Destination')['Overall_Rating'].agg(['mean', 'count'])
+        dest_performance = df.groupby('Destination', observed=True)['Overall_Rating'].agg(['mean', 'count'])
         dest_performance = dest_performance[dest_performance['count'] >= 10]
         dest_performance = dest_performance.sort_values('mean', ascending=False).head(10)
         
@@ -525,11 +582,10 @@ def analyze_class_and_traveler_segments(df):
     
     with col1:
         # Class performance
-        class_performance = df.groupby('Seat Type').agg({
-            'Overall_Rating': 'mean',
-            'Recommended': lambda x: (x == 'yes').mean() * 100
-        }).round(2)
-        class_performance.columns = ['Avg_Rating', 'Recommendation_Rate']
+        class_performance = df.groupby('Seat Type', observed=True).agg(
+            Avg_Rating=('Overall_Rating', 'mean'),
+            Recommendation_Rate=('Recommended_Flag', 'mean')
+        ).assign(Recommendation_Rate=lambda d: d['Recommendation_Rate'] * 100).round(2)
         class_performance = class_performance.sort_values('Avg_Rating', ascending=False)
         
         fig = go.Figure()
@@ -543,11 +599,10 @@ def analyze_class_and_traveler_segments(df):
         
     with col2:
         # Traveler type performance
-        traveler_performance = df.groupby('Type Of Traveller').agg({
-            'Overall_Rating': 'mean',
-            'Recommended': lambda x: (x == 'yes').mean() * 100
-        }).round(2)
-        traveler_performance.columns = ['Avg_Rating', 'Recommendation_Rate']
+        traveler_performance = df.groupby('Type Of Traveller', observed=True).agg(
+            Avg_Rating=('Overall_Rating', 'mean'),
+            Recommendation_Rate=('Recommended_Flag', 'mean')
+        ).assign(Recommendation_Rate=lambda d: d['Recommendation_Rate'] * 100).round(2)
         traveler_performance = traveler_performance.sort_values('Avg_Rating', ascending=False)
         
         fig = go.Figure()
@@ -578,8 +633,8 @@ def analyze_class_and_traveler_segments(df):
                  delta=f"{gap/economy_satisfaction*100:.1f}% improvement")
         
     with col2:
-        premium_rec = (premium_data['Recommended'] == 'yes').mean() * 100
-        economy_rec = (economy_data['Recommended'] == 'yes').mean() * 100
+        premium_rec = premium_data['Recommended_Flag'].mean() * 100
+        economy_rec = economy_data['Recommended_Flag'].mean() * 100
         rec_gap = premium_rec - economy_rec
         st.metric("Recommendation Gap", f"{rec_gap:.1f}%")
         
@@ -589,48 +644,51 @@ def analyze_class_and_traveler_segments(df):
         happy_gap = premium_happy - economy_happy
         st.metric("Happiness Gap", f"{happy_gap:.1f}%")
 
-def create_interactive_filters(df):
+FILTER_COLUMNS = ['Airline Name', 'Seat Type', 'Type Of Traveller']
+
+def _filter_options(df):
+    """Sidebar choices for each filter column"""
+    # Categories are already sorted and deduplicated, so this never scans the rows
+    return {col: ['All'] + df[col].cat.categories.tolist() for col in FILTER_COLUMNS}
+
+def create_interactive_filters(df, service_cols):
     """Create interactive filters for the dashboard"""
     st.sidebar.header("🔧 Dashboard Filters")
+    options = _filter_options(df)
     
     # Airline filter
-    airlines = ['All'] + sorted(df['Airline Name'].dropna().unique().tolist())
-    selected_airline = st.sidebar.selectbox("Select Airline", airlines)
+    selected_airline = st.sidebar.selectbox("Select Airline", options['Airline Name'])
     
     # Seat class filter
-    seat_classes = ['All'] + sorted(df['Seat Type'].dropna().unique().tolist())
-    selected_seat_class = st.sidebar.selectbox("Select Seat Class", seat_classes)
+    selected_seat_class = st.sidebar.selectbox("Select Seat Class", options['Seat Type'])
     
     # Traveler type filter
-    traveler_types = ['All'] + sorted(df['Type Of Traveller'].dropna().unique().tolist())
-    selected_traveler_type = st.sidebar.selectbox("Select Traveler Type", traveler_types)
+    selected_traveler_type = st.sidebar.selectbox("Select Traveler Type", options['Type Of Traveller'])
     
     # Rating range filter
     rating_range = st.sidebar.slider("Rating Range", 1.0, 10.0, (1.0, 10.0), 0.5)
     
-    # Apply filters
-    filtered_df = df.copy()
+    # Apply filters as one combined mask, compared on categorical codes
+    mask = np.ones(len(df), dtype=bool)
     
-    if selected_airline != 'All':
-        filtered_df = filtered_df[filtered_df['Airline Name'] == selected_airline]
+    selections = [selected_airline, selected_seat_class, selected_traveler_type]
+    for col, selected in zip(FILTER_COLUMNS, selections):
+        if selected != 'All':
+            code = df[col].cat.categories.get_loc(selected)
+            mask &= df[col].cat.codes.values == code
     
-    if selected_seat_class != 'All':
-        filtered_df = filtered_df[filtered_df['Seat Type'] == selected_seat_class]
-        
-    if selected_traveler_type != 'All':
-        filtered_df = filtered_df[filtered_df['Type Of Traveller'] == selected_traveler_type]
+    ratings = df['Overall_Rating'].values
+    mask &= (ratings >= rating_range[0]) & (ratings <= rating_range[1])
     
-    filtered_df = filtered_df[
-        (filtered_df['Overall_Rating'] >= rating_range[0]) & 
-        (filtered_df['Overall_Rating'] <= rating_range[1])
-    ]
+    filtered_df = df.loc[mask]
     
     # Show filter summary
+    metrics = _headline_metrics(filtered_df, service_cols)
     st.sidebar.markdown("---")
     st.sidebar.write(f"**Filtered Dataset:**")
-    st.sidebar.write(f"Reviews: {len(filtered_df):,} / {len(df):,}")
-    st.sidebar.write(f"Avg Rating: {filtered_df['Overall_Rating'].mean():.2f}")
-    st.sidebar.write(f"Happy Rate: {(filtered_df['Overall_Rating'] >= 8).mean()*100:.1f}%")
+    st.sidebar.write(f"Reviews: {metrics['total_reviews']:,} / {len(df):,}")
+    st.sidebar.write(f"Avg Rating: {metrics['avg_satisfaction']:.2f}")
+    st.sidebar.write(f"Happy Rate: {metrics['happy_rate']:.1f}%")
     
     return filtered_df
 
@@ -677,7 +735,7 @@ def main():
         return
     
     # Apply filters
-    filtered_df = create_interactive_filters(df)
+    filtered_df = create_interactive_filters(df, service_cols)
     
     # Main dashboard sections
     create_satisfaction_overview(filtered_df, service_cols)
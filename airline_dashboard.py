@@ -6,9 +6,21 @@ import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import functools
+import hashlib
+import importlib.util
+import os
+import tempfile
 import warnings
 warnings.filterwarnings('ignore')
 
+# PyArrow gives pandas a multi-threaded CSV parser and columnar UTF-8 string kernels
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# Polars (optional) runs the large per-airline/per-route groupbys multi-threaded;
+# it hands frames to and from pandas through Arrow, so it also needs PyArrow
+POLARS_AVAILABLE = PYARROW_AVAILABLE and importlib.util.find_spec('polars') is not None
+
 # Page configuration
 st.set_page_config(
     page_title="Airline Experience Analytics Dashboard",
@@ -51,62 +63,128 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Columns the dashboard reads from the review CSV, and a Parquet copy for fast reloads
+DATA_FILE = 'Airline Review.csv'
+PARQUET_CACHE = 'airline_review_basic.parquet'
+DATA_COLUMNS = ['Airline Name', 'Overall_Rating', 'Review Date', 'Review', 'Type Of Traveller',
+                'Seat Type', 'Route', 'Seat Comfort', 'Cabin Staff Service', 'Food & Beverages',
+                'Ground Service', 'Inflight Entertainment', 'Wifi & Connectivity', 'Value For Money',
+                'Recommended']
+
+def _read_review_data():
+    """Read the dashboard columns, preferring an up-to-date Parquet copy of the CSV"""
+    if os.path.exists(PARQUET_CACHE) and os.path.getmtime(PARQUET_CACHE) >= os.path.getmtime(DATA_FILE):
+        try:
+            cached = pd.read_parquet(PARQUET_CACHE)
+        except (ImportError, OSError, ValueError):
+            # An unreadable or truncated copy is just a cache miss; rebuild it from the CSV
+            cached = None
+        # A copy written before DATA_COLUMNS changed is stale even if it is newer than the CSV
+        if cached is not None and set(DATA_COLUMNS).issubset(cached.columns):
+            return cached
+    
+    # The CSV's unnamed index column is labelled differently by each parser engine
+    engine, index_column = ('pyarrow', '') if PYARROW_AVAILABLE else ('c', 'Unnamed: 0')
+    df = pd.read_csv(DATA_FILE, index_col=0, usecols=[index_column] + DATA_COLUMNS, engine=engine,
+                     dtype={'Airline Name': 'category', 'Seat Type': 'category',
+                            'Type Of Traveller': 'category', 'Recommended': 'category'})
+    _write_parquet_cache(df)
+    return df
+
+def _write_parquet_cache(df):
+    """Save the Parquet copy via a temp file so no reader ever sees a partial write"""
+    tmp_path = None
+    try:
+        # Same directory as the cache, so os.replace is an atomic rename
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(PARQUET_CACHE)),
+                                        suffix='.parquet.tmp')
+        os.close(fd)
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, PARQUET_CACHE)
+    except (ImportError, OSError):
+        # Parquet support (pyarrow/fastparquet) is optional; keep using the CSV
+        pass
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _frame_fingerprint(df):
+    """Cheap cache key for frames sliced from the cached dataset"""
+    # Filtered frames are row subsets of the same loaded data, so the row labels
+    # and column set identify them without hashing every cell
+    return hashlib.md5(np.ascontiguousarray(df.index.values).tobytes()).hexdigest(), tuple(df.columns)
+
+_FRAME_HASH_FUNCS = {pd.DataFrame: _frame_fingerprint}
+
 @st.cache_data
 def load_and_process_data():
     """Load and process the airline review data"""
     try:
         # Load the main dataset
-        df = pd.read_csv('Airline Review.csv', index_col=0)
+        df = _read_review_data()
         
-        # Parse routes into origin, destination, via
-        def parse_route(route_str):
-            if pd.isna(route_str):
-                return None, None, None
-            
-            route_str = str(route_str).strip()
-            
-            if " via " in route_str.lower():
-                main_route, via_part = route_str.split(" via ", 1)
-                via_city = via_part.strip()
-                
-                if " to " in main_route.lower():
-                    origin, destination = main_route.split(" to ", 1)
-                    return origin.strip(), destination.strip(), via_city
-                else:
-                    return route_str, None, None
-            
-            elif " to " in route_str.lower():
-                parts = route_str.split(" to ", 1)
-                if len(parts) == 2:
-                    return parts[0].strip(), parts[1].strip(), None
-                else:
-                    return route_str, None, None
-            else:
-                return route_str, None, None
+        # Convert Overall_Rating to numeric and drop rows without a valid rating ('n')
+        df['Overall_Rating'] = pd.to_numeric(df['Overall_Rating'], errors='coerce')
+        df = df.dropna(subset=['Overall_Rating'])
         
-        # Apply route parsing
-        route_data = df['Route'].apply(parse_route)
-        df['Origin'] = [x[0] for x in route_data]
-        df['Destination'] = [x[1] for x in route_data]
-        df['Via'] = [x[2] for x in route_data]
-        
-        # Create satisfaction segments
-        def categorize_satisfaction(rating):
-            if rating >= 8:
-                return 'Happy (8-10)'
-            elif rating >= 6:
-                return 'Neutral (6-7)'
-            elif rating >= 3:
-                return 'Disappointed (3-5)'
-            else:
-                return 'Very Disappointed (1-2)'
-        
-        df['Satisfaction_Segment'] = df['Overall_Rating'].apply(categorize_satisfaction)
+        # Ratings are small integers (1-10 overall, 1-5 per service), so 1-byte ints
+        # cut the working set of every groupby/mean; means still come back as float64
+        df['Overall_Rating'] = df['Overall_Rating'].astype(np.int8)
         
         # Define service columns
         service_cols = ['Seat Comfort', 'Cabin Staff Service', 'Food & Beverages', 
                        'Ground Service', 'Inflight Entertainment', 'Wifi & Connectivity', 
                        'Value For Money']
+        for col in service_cols:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int8')
+        
+        # Parse routes into origin, destination, via (vectorized string splits);
+        # separators are matched case-insensitively since some routes use "To"/"Via"
+        routes = df['Route'].astype('string').str.strip()
+        route_parts = routes.str.split(r'(?i)\s+via\s+', n=1, regex=True, expand=True).reindex(columns=[0, 1])
+        origin_dest = route_parts[0].str.split(r'(?i)\s+to\s+', n=1, regex=True, expand=True).reindex(columns=[0, 1])
+        
+        # Routes without an "origin to destination" part keep the raw route as origin
+        has_destination = origin_dest[1].notna()
+        df[['Origin', 'Destination', 'Via']] = pd.DataFrame({
+            'Origin': origin_dest[0].str.strip().where(has_destination, routes),
+            'Destination': origin_dest[1].str.strip(),
+            'Via': route_parts[1].str.strip().where(has_destination)
+        })
+        
+        # Parse review dates once ("11th November 2019"); an explicit format skips
+        # per-row inference, which also rejected the 1st/2nd/3rd suffixes
+        df['Review Date'] = pd.to_datetime(
+            df['Review Date'].str.replace(r'(\d+)(?:st|nd|rd|th)\b', r'\1', regex=True),
+            format='%d %B %Y', errors='coerce'
+        )
+        
+        # Create satisfaction segments (<3, 3-5, 6-7, 8+)
+        df['Satisfaction_Segment'] = pd.cut(
+            df['Overall_Rating'],
+            bins=[-np.inf, 3, 6, 8, np.inf],
+            labels=['Very Disappointed (1-2)', 'Disappointed (3-5)', 'Neutral (6-7)', 'Happy (8-10)'],
+            right=False
+        )
+        
+        # Store low-cardinality grouping/filter columns as categoricals
+        for col in ['Airline Name', 'Seat Type', 'Type Of Traveller', 'Recommended',
+                    'Origin', 'Destination', 'Route']:
+            df[col] = df[col].astype('category')
+        
+        # Review text as an Arrow-backed string column; lengths computed once here
+        df['Review'] = df['Review'].astype('string[pyarrow]' if PYARROW_AVAILABLE else 'string')
+        df['Review_Length'] = df['Review'].str.len().fillna(0).astype(np.int32)
+        
+        # Integer happy/recommended flags so groupbys can use the built-in mean
+        df['Happy_Flag'] = (df['Overall_Rating'] >= 8).astype(np.uint8)
+        df['Recommended_Flag'] = (df['Recommended'] == 'yes').astype(np.uint8)
+        
+        # Happy (8+) / frustrated (3 or less) bucket for the service comparison
+        df['Rating_Group'] = pd.Categorical(
+            np.where(df['Overall_Rating'] >= 8, 'happy', np.where(df['Overall_Rating'] <= 3, 'frustrated', 'other')),
+            categories=['happy', 'frustrated', 'other']
+        )
         
         return df, service_cols
         
@@ -114,37 +192,47 @@ def load_and_process_data():
         st.error(f"Error loading data: {e}")
         return None, None
 
+@st.cache_data(hash_funcs=_FRAME_HASH_FUNCS, show_spinner=False)
+def _overview_metrics(df, service_cols):
+    """Formatted headline KPIs for the overview section"""
+    ratings = df['Overall_Rating'].to_numpy()
+    avg_satisfaction = ratings.mean()
+    happy_rate = df['Happy_Flag'].to_numpy().mean() * 100
+    recommendation_rate = df['Recommended_Flag'].to_numpy().mean() * 100
+    # Int8 means come back as nullable Float64; plain floats keep an empty slice as nan, not <NA>
+    service_quality = df[service_cols].mean().astype(float).mean()
+    return (f"{avg_satisfaction:.2f}/10", f"{happy_rate:.1f}%",
+            f"{recommendation_rate:.1f}%", f"{service_quality:.2f}/5")
+
 def create_satisfaction_overview(df, service_cols):
     """Create satisfaction overview metrics and charts"""
     st.markdown('<div class="section-header">📊 Flight Experience Satisfaction Overview</div>', unsafe_allow_html=True)
     
     # Key metrics
+    avg_satisfaction, happy_rate, recommendation_rate, service_quality = _overview_metrics(df, service_cols)
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        avg_satisfaction = df['Overall_Rating'].mean()
-        st.metric("Average Satisfaction", f"{avg_satisfaction:.2f}/10")
+        st.metric("Average Satisfaction", avg_satisfaction)
         
     with col2:
-        happy_rate = (df['Overall_Rating'] >= 8).mean() * 100
-        st.metric("Happy Customers", f"{happy_rate:.1f}%")
+        st.metric("Happy Customers", happy_rate)
         
     with col3:
-        recommendation_rate = (df['Recommended'] == 'yes').mean() * 100
-        st.metric("Recommendation Rate", f"{recommendation_rate:.1f}%")
+        st.metric("Recommendation Rate", recommendation_rate)
         
     with col4:
-        service_quality = df[service_cols].mean().mean()
-        st.metric("Service Quality", f"{service_quality:.2f}/5")
+        st.metric("Service Quality", service_quality)
     
     # Satisfaction distribution
     col1, col2 = st.columns(2)
     
     with col1:
-        fig = px.histogram(df, x='Overall_Rating', nbins=10, 
-                          title="Overall Rating Distribution",
-                          color_discrete_sequence=['#1f77b4'])
-        fig.update_layout(showlegend=False)
+        # Count ratings on the server so only the 10 bar heights are sent to the browser
+        counts = np.bincount(df['Overall_Rating'].to_numpy(), minlength=11)[1:11]
+        fig = go.Figure(go.Bar(x=np.arange(1, 11), y=counts, marker_color='#1f77b4'))
+        fig.update_layout(title="Overall Rating Distribution", xaxis_title="Overall_Rating",
+                         yaxis_title="count", bargap=0, showlegend=False)
         st.plotly_chart(fig, use_container_width=True)
         
     with col2:
@@ -154,17 +242,27 @@ def create_satisfaction_overview(df, service_cols):
                     color_discrete_sequence=['#ff4444', '#ff8800', '#88ccff', '#44ff44'])
         st.plotly_chart(fig, use_container_width=True)
 
+@st.cache_data(hash_funcs=_FRAME_HASH_FUNCS, show_spinner=False)
+def _service_correlations(df, service_cols):
+    """Correlation of each service rating with the overall rating"""
+    # One pairwise correlation matrix instead of a pass per service column
+    correlations = df[service_cols + ['Overall_Rating']].corr()['Overall_Rating'].drop('Overall_Rating')
+    return (correlations.rename_axis('Service').reset_index(name='Correlation')
+            .sort_values('Correlation', ascending=False))
+
+@st.cache_data(hash_funcs=_FRAME_HASH_FUNCS, show_spinner=False)
+def _happy_vs_frustrated_means(df, service_cols):
+    """Average service ratings of happy (8+) and frustrated (3 or less) passengers"""
+    # Single groupby pass instead of two masked sub-frames; empty buckets come back as NaN
+    group_means = df.groupby('Rating_Group', observed=False)[service_cols].mean().astype(float)
+    return group_means.loc['happy'], group_means.loc['frustrated']
+
 def analyze_happiness_drivers(df, service_cols):
     """Analyze what makes passengers happiest or most frustrated"""
     st.markdown('<div class="section-header">😊 What Makes Passengers Happy vs Frustrated</div>', unsafe_allow_html=True)
     
     # Service correlation analysis
-    correlations = []
-    for col in service_cols:
-        corr = df[col].corr(df['Overall_Rating'])
-        correlations.append({'Service': col, 'Correlation': corr})
-    
-    corr_df = pd.DataFrame(correlations).sort_values('Correlation', ascending=False)
+    corr_df = _service_correlations(df, service_cols)
     
     col1, col2 = st.columns(2)
     
@@ -184,11 +282,7 @@ def analyze_happiness_drivers(df, service_cols):
     
     with col2:
         # Compare happy vs frustrated passengers
-        happy_passengers = df[df['Overall_Rating'] >= 8]
-        frustrated_passengers = df[df['Overall_Rating'] <= 3]
-        
-        happy_means = happy_passengers[service_cols].mean()
-        frustrated_means = frustrated_passengers[service_cols].mean()
+        happy_means, frustrated_means = _happy_vs_frustrated_means(df, service_cols)
         
         comparison_df = pd.DataFrame({
             'Happy Passengers': happy_means,
@@ -224,9 +318,7 @@ def analyze_traveler_segments(df):
     
     with col1:
         # Happiness rate by traveler type
-        traveler_happiness = df.groupby('Type Of Traveller').apply(
-            lambda x: (x['Overall_Rating'] >= 8).mean() * 100
-        ).sort_values(ascending=False)
+        traveler_happiness = (df.groupby('Type Of Traveller', observed=True)['Happy_Flag'].mean() * 100).sort_values(ascending=False)
         
         fig = px.bar(x=traveler_happiness.index, y=traveler_happiness.values,
                     title="Happiness Rate by Traveler Type",
@@ -237,9 +329,7 @@ def analyze_traveler_segments(df):
         
     with col2:
         # Happiness rate by seat class
-        seat_happiness = df.groupby('Seat Type').apply(
-            lambda x: (x['Overall_Rating'] >= 8).mean() * 100
-        ).sort_values(ascending=False)
+        seat_happiness = (df.groupby('Seat Type', observed=True)['Happy_Flag'].mean() * 100).sort_values(ascending=False)
         
         fig = px.bar(x=seat_happiness.index, y=seat_happiness.values,
                     title="Happiness Rate by Seat Class",
@@ -256,6 +346,31 @@ def analyze_traveler_segments(df):
     st.write(f"• Business travelers satisfaction: **{traveler_happiness.get('Business', 0):.1f}%**")
     st.markdown('</div>', unsafe_allow_html=True)
 
+def _rating_stats_by(df, key, with_recommendation=False):
+    """Mean rating and review count (optionally recommendation share) per value of key"""
+    if POLARS_AVAILABLE:
+        import polars as pl
+        columns = [key, 'Overall_Rating']
+        aggs = [pl.col('Overall_Rating').mean().alias('Avg_Rating'), pl.len().alias('Review_Count')]
+        if with_recommendation:
+            columns.append('Recommended_Flag')
+            aggs.append(pl.col('Recommended_Flag').mean().alias('Recommendation_Rate'))
+        stats = pl.from_pandas(df[columns]).drop_nulls(key).group_by(key).agg(aggs).to_pandas()
+        # Restore the pandas categories so groups come back in the same order as groupby
+        stats[key] = stats[key].cat.set_categories(df[key].cat.categories)
+        return stats.set_index(key).sort_index()
+    
+    aggs = {'Avg_Rating': ('Overall_Rating', 'mean'), 'Review_Count': ('Overall_Rating', 'size')}
+    if with_recommendation:
+        aggs['Recommendation_Rate'] = ('Recommended_Flag', 'mean')
+    return df.groupby(key, observed=True).agg(**aggs)
+
+@st.cache_data(hash_funcs=_FRAME_HASH_FUNCS, show_spinner=False)
+def _route_satisfaction(df):
+    """Average rating per route (routes with 10+ reviews)"""
+    route_satisfaction = _rating_stats_by(df, 'Route').round(2)
+    return route_satisfaction[route_satisfaction['Review_Count'] >= 10]  # Filter for meaningful sample sizes
+
 def analyze_geographic_performance(df):
     """Analyze performance across regions and routes"""
     st.markdown('<div class="section-header">🌍 Geographic Performance Analysis</div>', unsafe_allow_html=True)
@@ -264,7 +379,8 @@ def analyze_geographic_performance(df):
     col1, col2 = st.columns(2)
     
     with col1:
-        origin_volume = df['Origin'].value_counts().head(10)
+        # Categorical value_counts lists every category; drop the ones the filter emptied
+        origin_volume = df['Origin'].value_counts().loc[lambda counts: counts > 0].head(10)
         fig = px.bar(x=origin_volume.values, y=origin_volume.index, orientation='h',
                     title="Top 10 Origin Cities by Volume",
                     color=origin_volume.values, color_continuous_scale='Blues')
@@ -272,7 +388,7 @@ def analyze_geographic_performance(df):
         st.plotly_chart(fig, use_container_width=True)
         
     with col2:
-        dest_volume = df['Destination'].value_counts().head(10)
+        dest_volume = df['Destination'].value_counts().loc[lambda counts: counts > 0].head(10)
         fig = px.bar(x=dest_volume.values, y=dest_volume.index, orientation='h',
                     title="Top 10 Destination Cities by Volume",
                     color=dest_volume.values, color_continuous_scale='Greens')
@@ -280,17 +396,13 @@ def analyze_geographic_performance(df):
         st.plotly_chart(fig, use_container_width=True)
     
     # Route satisfaction analysis
-    route_satisfaction = df.groupby('Route').agg({
-        'Overall_Rating': ['mean', 'count']
-    }).round(2)
-    route_satisfaction.columns = ['Avg_Rating', 'Review_Count']
-    route_satisfaction = route_satisfaction[route_satisfaction['Review_Count'] >= 10]  # Filter for meaningful sample sizes
-    route_satisfaction = route_satisfaction.sort_values('Avg_Rating', ascending=False)
+    route_satisfaction = _route_satisfaction(df)
     
     col1, col2 = st.columns(2)
     
     with col1:
-        top_routes = route_satisfaction.head(10)
+        # Partial selection instead of sorting every route
+        top_routes = route_satisfaction.nlargest(10, 'Avg_Rating')
         fig = px.bar(x=top_routes['Avg_Rating'], y=top_routes.index, orientation='h',
                     title="Top 10 Routes by Satisfaction",
                     color=top_routes['Avg_Rating'], color_continuous_scale='RdYlGn')
@@ -298,30 +410,32 @@ def analyze_geographic_performance(df):
         st.plotly_chart(fig, use_container_width=True)
         
     with col2:
-        bottom_routes = route_satisfaction.tail(10)
+        bottom_routes = route_satisfaction.nsmallest(10, 'Avg_Rating').iloc[::-1]
         fig = px.bar(x=bottom_routes['Avg_Rating'], y=bottom_routes.index, orientation='h',
                     title="Bottom 10 Routes by Satisfaction",
                     color=bottom_routes['Avg_Rating'], color_continuous_scale='Reds_r')
         fig.update_layout(showlegend=False, height=400)
         st.plotly_chart(fig, use_container_width=True)
 
+@st.cache_data(hash_funcs=_FRAME_HASH_FUNCS, show_spinner=False)
+def _airline_metrics(df):
+    """Per-airline rating and recommendation metrics (airlines with 20+ reviews)"""
+    airline_metrics = _rating_stats_by(df, 'Airline Name', with_recommendation=True).assign(
+        Recommendation_Rate=lambda d: d['Recommendation_Rate'] * 100
+    ).round(2)
+    return airline_metrics[airline_metrics['Review_Count'] >= 20]  # Filter for meaningful data
+
 def analyze_competitive_landscape(df):
     """Analyze how airlines stack up against competitors"""
     st.markdown('<div class="section-header">🏆 Competitive Landscape Analysis</div>', unsafe_allow_html=True)
     
     # Airline performance metrics
-    airline_metrics = df.groupby('Airline Name').agg({
-        'Overall_Rating': ['mean', 'count'],
-        'Recommended': lambda x: (x == 'yes').mean() * 100
-    }).round(2)
-    airline_metrics.columns = ['Avg_Rating', 'Review_Count', 'Recommendation_Rate']
-    airline_metrics = airline_metrics[airline_metrics['Review_Count'] >= 20]  # Filter for meaningful data
-    airline_metrics = airline_metrics.sort_values('Avg_Rating', ascending=False)
+    airline_metrics = _airline_metrics(df)
     
     col1, col2 = st.columns(2)
     
     with col1:
-        top_airlines = airline_metrics.head(15)
+        top_airlines = airline_metrics.nlargest(15, 'Avg_Rating')
         fig = px.bar(x=top_airlines['Avg_Rating'], y=top_airlines.index, orientation='h',
                     title="Top 15 Airlines by Average Rating",
                     color=top_airlines['Avg_Rating'], color_continuous_scale='RdYlGn')
@@ -340,11 +454,11 @@ def analyze_competitive_landscape(df):
     # Airline performance insights
     st.markdown('<div class="insight-box">', unsafe_allow_html=True)
     st.write("**Competitive Insights:**")
-    best_airline = airline_metrics.iloc[0]
-    worst_airline = airline_metrics.iloc[-1]
-    st.write(f"• Best performing airline: **{best_airline.name}** ({best_airline['Avg_Rating']:.2f}/10)")
+    avg_ratings = airline_metrics['Avg_Rating']
+    best_airline = avg_ratings.idxmax()
+    st.write(f"• Best performing airline: **{best_airline}** ({avg_ratings[best_airline]:.2f}/10)")
     st.write(f"• Highest recommendation rate: **{airline_metrics['Recommendation_Rate'].idxmax()}** ({airline_metrics['Recommendation_Rate'].max():.1f}%)")
-    st.write(f"• Performance gap: **{best_airline['Avg_Rating'] - worst_airline['Avg_Rating']:.2f}** points between best and worst")
+    st.write(f"• Performance gap: **{avg_ratings.max() - avg_ratings.min():.2f}** points between best and worst")
     st.markdown('</div>', unsafe_allow_html=True)
 
 def analyze_review_themes(df):
@@ -388,9 +502,8 @@ def analyze_review_themes(df):
         for i, theme in enumerate(negative_themes, 1):
             st.write(f"{i}. {theme}")
     
-    # Review length analysis
-    df['Review_Length'] = df['Review'].fillna('').astype(str).str.len()
-    review_satisfaction = df.groupby('Satisfaction_Segment')['Review_Length'].mean()
+    # Review length analysis (Review_Length is precomputed in the loader)
+    review_satisfaction = df.groupby('Satisfaction_Segment', observed=True)['Review_Length'].mean()
     
     fig = px.bar(x=review_satisfaction.index, y=review_satisfaction.values,
                 title="Average Review Length by Satisfaction Level",
@@ -401,50 +514,70 @@ def analyze_review_themes(df):
     # Key insights from review analysis
     st.markdown('<div class="insight-box">', unsafe_allow_html=True)
     st.write("**Review Pattern Insights:**")
-    happy_avg_length = df[df['Satisfaction_Segment'] == 'Happy (8-10)']['Review_Length'].mean()
-    frustrated_avg_length = df[df['Satisfaction_Segment'] == 'Very Disappointed (1-2)']['Review_Length'].mean()
+    # Reuse the per-segment means; a segment missing from the filtered data gives NaN
+    happy_avg_length = review_satisfaction.get('Happy (8-10)', np.nan)
+    frustrated_avg_length = review_satisfaction.get('Very Disappointed (1-2)', np.nan)
     st.write(f"• Frustrated customers write **{frustrated_avg_length/happy_avg_length:.1f}x** longer reviews")
     st.write(f"• Most common complaint categories: Service, Delays, Comfort")
     st.write(f"• Hidden pain points: Communication gaps, expectation mismatches")
     st.markdown('</div>', unsafe_allow_html=True)
 
+FILTER_COLUMNS = ['Airline Name', 'Seat Type', 'Type Of Traveller']
+
+def _filter_options(df):
+    """Sidebar choices for each filter column"""
+    # Categories are already sorted and deduplicated, so this never scans the rows
+    return {col: ['All'] + df[col].cat.categories.tolist() for col in FILTER_COLUMNS}
+
+@st.cache_data(hash_funcs=_FRAME_HASH_FUNCS, show_spinner=False)
+def _filter_row_index(df):
+    """Sorted row positions for every category of each filter column"""
+    rows_by = {}
+    for col in FILTER_COLUMNS:
+        codes = df[col].cat.codes.to_numpy()
+        # One stable sort groups the rows by category code, keeping positions ascending
+        valid = np.flatnonzero(codes >= 0)
+        order = valid[np.argsort(codes[valid], kind='stable')]
+        counts = np.bincount(codes[valid], minlength=len(df[col].cat.categories))
+        rows_by[col] = dict(zip(df[col].cat.categories, np.split(order, np.cumsum(counts)[:-1])))
+    return rows_by
+
 def create_interactive_filters(df):
     """Create interactive filters for the dashboard"""
     st.sidebar.header("🔧 Dashboard Filters")
     
     # Date range filter
     if 'Review Date' in df.columns:
-        df['Review Date'] = pd.to_datetime(df['Review Date'], errors='coerce')
+        # Dates are parsed by the loader; only the bounds are needed here
+        first_date, last_date = df['Review Date'].min(), df['Review Date'].max()
         date_range = st.sidebar.date_input(
             "Select Date Range",
-            value=(df['Review Date'].min(), df['Review Date'].max()),
-            min_value=df['Review Date'].min(),
-            max_value=df['Review Date'].max()
+            value=(first_date, last_date),
+            min_value=first_date,
+            max_value=last_date
         )
     
+    options = _filter_options(df)
+    
     # Airline filter
-    airlines = ['All'] + sorted(df['Airline Name'].dropna().unique().tolist())
-    selected_airline = st.sidebar.selectbox("Select Airline", airlines)
+    selected_airline = st.sidebar.selectbox("Select Airline", options['Airline Name'])
     
     # Seat class filter
-    seat_classes = ['All'] + sorted(df['Seat Type'].dropna().unique().tolist())
-    selected_seat_class = st.sidebar.selectbox("Select Seat Class", seat_classes)
+    selected_seat_class = st.sidebar.selectbox("Select Seat Class", options['Seat Type'])
     
     # Traveler type filter
-    traveler_types = ['All'] + sorted(df['Type Of Traveller'].dropna().unique().tolist())
-    selected_traveler_type = st.sidebar.selectbox("Select Traveler Type", traveler_types)
-    
-    # Apply filters
-    filtered_df = df.copy()
-    
-    if selected_airline != 'All':
-        filtered_df = filtered_df[filtered_df['Airline Name'] == selected_airline]
-    
-    if selected_seat_class != 'All':
-        filtered_df = filtered_df[filtered_df['Seat Type'] == selected_seat_class]
-        
-    if selected_traveler_type != 'All':
-        filtered_df = filtered_df[filtered_df['Type Of Traveller'] == selected_traveler_type]
+    selected_traveler_type = st.sidebar.selectbox("Select Traveler Type", options['Type Of Traveller'])
+    
+    # Apply filters by intersecting the precomputed row positions of each selection
+    rows_by = _filter_row_index(df)
+    selections = [selected_airline, selected_seat_class, selected_traveler_type]
+    chosen = [rows_by[col][selected] for col, selected in zip(FILTER_COLUMNS, selections) if selected != 'All']
+    
+    if chosen:
+        rows = functools.reduce(functools.partial(np.intersect1d, assume_unique=True), chosen)
+        filtered_df = df.iloc[rows]
+    else:
+        filtered_df = df
     
     # Show filter summary
     st.sidebar.markdown("---")
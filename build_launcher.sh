@@ -0,0 +1,16 @@
+#!/bin/bash
+
+# Build a single-file launcher archive (dsdr_launch.pyz) with precompiled bytecode
+echo "📦 Building dsdr_launch.pyz..."
+
+BUILD_DIR=$(mktemp -d)
+trap 'rm -rf "$BUILD_DIR"' EXIT
+
+cp launch_dashboard.py "$BUILD_DIR/"
+
+# Legacy-layout .pyc next to the source, which is where zipimport looks for bytecode;
+# -d "" records the archive-relative path instead of the temp dir deleted below
+python -m compileall -q -b -d "" "$BUILD_DIR" || exit 1
+python -m zipapp "$BUILD_DIR" -m "launch_dashboard:main" -p "/usr/bin/env python3" -o dsdr_launch.pyz || exit 1
+
+echo "✅ Built dsdr_launch.pyz - run it from the project directory with: python dsdr_launch.pyz"
@@ -5,92 +5,397 @@ Airline Dashboard Launcher
 This script helps you launch the airline analytics dashboard with proper setup.
 """
 
+import argparse
 import subprocess
 import sys
 import os
+import hashlib
+import importlib.metadata
+import json
+import runpy
+import shutil
+import site
+import sysconfig
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+DATA_FILE = "Airline Review.csv"
+DASHBOARD_FILE = "advanced_airline_dashboard.py"
+REQUIREMENTS_FILE = "requirements_advanced.txt"
+
+# Marker recording the last successful install, so unchanged setups skip pip
+CACHE_DIR = Path.home() / ".cache" / "dsdr"
+REQUIREMENTS_MARKER = CACHE_DIR / "req.json"
+
+# Streamlit console-script location per interpreter, reused across runs
+PATHS_CACHE = CACHE_DIR / "paths.json"
+
+# Persistent wheel cache so reinstalls in fresh environments skip downloads and builds
+PIP_CACHE_DIR = CACHE_DIR / "pip"
+
+# Optional local wheelhouse for offline installs
+# (populate with: pip download -r requirements_advanced.txt -d wheels/)
+WHEELS_DIR = Path("wheels")
+
+# Beyond this size the launcher estimates the review count from a sample
+ROW_ESTIMATE_THRESHOLD = 100 * 1024 * 1024
+ROW_SAMPLE_BYTES = 1 << 20
+
+# One stat() per path per run; later size lookups reuse the result
+_STAT_CACHE = {}
+_DIR_ENTRIES = None
+
+def current_dir_entries():
+    """Entries of the working directory, read with a single scandir pass"""
+    global _DIR_ENTRIES
+    if _DIR_ENTRIES is None:
+        with os.scandir(".") as entries:
+            _DIR_ENTRIES = {entry.name: entry for entry in entries}
+    return _DIR_ENTRIES
+
+def stat_file(filename):
+    """Stat a file once, returning None if it does not exist"""
+    if filename not in _STAT_CACHE:
+        try:
+            if os.path.dirname(filename):
+                _STAT_CACHE[filename] = os.stat(filename)
+            else:
+                # Files next to the launcher: existence comes from the directory listing
+                entry = current_dir_entries().get(filename)
+                _STAT_CACHE[filename] = entry.stat() if entry is not None else None
+        except OSError:
+            _STAT_CACHE[filename] = None
+    return _STAT_CACHE[filename]
+
 def check_file_exists(filename):
     """Check if required data file exists"""
-    if not os.path.exists(filename):
+    if stat_file(filename) is None:
         print(f"❌ Error: {filename} not found!")
         print(f"💡 Please ensure '{filename}' is in the current directory:")
         print(f"   Current directory: {os.getcwd()}")
         return False
     return True
 
-def install_requirements():
+def requirements_hash():
+    """Hash of the requirements file together with the installed package versions"""
+    digest = hashlib.sha256(Path(REQUIREMENTS_FILE).read_bytes())
+    installed = sorted(f"{dist.metadata['Name']}=={dist.version}" for dist in importlib.metadata.distributions())
+    digest.update("\n".join(installed).encode())
+    return digest.hexdigest()
+
+def requirements_mtimes():
+    """Modification times of the requirements file and the site-packages directories"""
+    # Installing or removing a package touches its site-packages directory
+    site_dirs = {sysconfig.get_path("purelib"), sysconfig.get_path("platlib"), site.getusersitepackages()}
+    paths = [REQUIREMENTS_FILE] + sorted(d for d in site_dirs if os.path.isdir(d))
+    return [os.stat(path).st_mtime_ns for path in paths]
+
+def requirements_cached():
+    """Check if the requirements were installed into this environment unchanged"""
+    try:
+        marker = json.loads(REQUIREMENTS_MARKER.read_text())
+        # Nothing touched since the last install: a few stat() calls settle it
+        if marker.get("mtime_ns") == requirements_mtimes():
+            return True
+        if marker.get("sha") != requirements_hash():
+            return False
+    except (OSError, ValueError, AttributeError):
+        return False
+    
+    # Touched but unchanged; refresh the times so the next run is stat-only again
+    save_requirements_marker()
+    return True
+
+def save_requirements_marker():
+    """Remember the current requirements/environment state after a successful install"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        marker = {"mtime_ns": requirements_mtimes(), "sha": requirements_hash()}
+        REQUIREMENTS_MARKER.write_text(json.dumps(marker))
+    except OSError:
+        # The cache is only an optimisation; pip simply runs again next time
+        pass
+
+def requirement_met(req):
+    """Check whether one parsed requirement is installed at a matching version"""
+    try:
+        installed = importlib.metadata.version(req.name)
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    return req.specifier.contains(installed, prereleases=True)
+
+def unmet_requirements():
+    """List requirements that are missing or out of spec, or None if they can't be checked"""
+    try:
+        from packaging.requirements import InvalidRequirement, Requirement
+    except ImportError:
+        return None
+    
+    try:
+        lines = Path(REQUIREMENTS_FILE).read_text().splitlines()
+    except OSError:
+        return None
+    
+    requirements = {}
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        if line.startswith("-"):
+            # pip options (-e, --index-url, ...) only make sense with -r
+            return None
+        try:
+            req = Requirement(line)
+        except InvalidRequirement:
+            # Leave anything unusual to pip
+            return None
+        if req.marker is None or req.marker.evaluate():
+            requirements[line] = req
+    
+    # Each lookup scans sys.path on disk, so check them all concurrently
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        met = list(pool.map(requirement_met, requirements.values()))
+    return [line for line, ok in zip(requirements, met) if not ok]
+
+def pip_install_command(*args, use_uv=True):
+    """Build the install command: uv when available, else pip with the wheel cache"""
+    uv = shutil.which("uv") if use_uv else None
+    if uv:
+        # uv resolves and downloads in parallel, always prefers wheels and keeps its
+        # own cache; --python targets this interpreter (and so the active venv)
+        return [uv, "pip", "install", "--python", sys.executable, *args]
+    
+    try:
+        PIP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_args = ["--cache-dir", str(PIP_CACHE_DIR)]
+    except OSError:
+        cache_args = []
+    return [sys.executable, "-m", "pip", "install", *cache_args, "--prefer-binary", *args]
+
+def run_install_command(command, in_process=False):
+    """Run an install command and return its exit code"""
+    if in_process and command[:3] == [sys.executable, "-m", "pip"]:
+        # Run pip inside this interpreter to skip a second Python startup. pip's
+        # modules and global state stay loaded in the launcher afterwards.
+        saved_argv = sys.argv
+        sys.argv = ["pip", *command[3:]]
+        try:
+            runpy.run_module("pip", run_name="__main__", alter_sys=True)
+            return 0
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else int(e.code is not None)
+        finally:
+            sys.argv = saved_argv
+    return subprocess.call(command)
+
+def run_pip_install(*args, in_process=False):
+    """Run pip install, trying the local wheels/ directory first when it exists"""
+    # uv is a separate binary and can't run in-process, so asking for in-process pip skips it
+    use_uv = not in_process
+    if WHEELS_DIR.is_dir():
+        offline = pip_install_command("--no-index", "--find-links", str(WHEELS_DIR.resolve()), *args,
+                                      use_uv=use_uv)
+        if run_install_command(offline, in_process) == 0:
+            return
+        print(f"⚠️ Offline install from {WHEELS_DIR}/ failed, retrying from the package index...")
+    command = pip_install_command(*args, use_uv=use_uv)
+    returncode = run_install_command(command, in_process)
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, command)
+
+def install_requirements(in_process_pip=False):
     """Install required packages"""
+    # pip reports a missing -r file as a plain failure, so check for it up front
+    if not Path(REQUIREMENTS_FILE).is_file():
+        print(f"⚠️ {REQUIREMENTS_FILE} not found, installing core packages...")
+        try:
+            # These have wheels for every supported platform; never fall back to compiling them
+            run_pip_install("--only-binary=scipy,scikit-learn,pandas,numpy",
+                            "streamlit", "pandas", "matplotlib", "seaborn", "plotly", "scipy", "scikit-learn",
+                            in_process=in_process_pip)
+            print("✅ Core packages installed!")
+            return True
+        except subprocess.CalledProcessError as e:
+            print(f"❌ Error installing core packages: {e}")
+            return False
+    
+    if requirements_cached():
+        print("✅ Requirements already satisfied (cache hit)")
+        return True
+    
+    # Only run pip when something is actually missing or out of spec
+    unmet = unmet_requirements()
+    if unmet == []:
+        print("✅ All requirements satisfied")
+        save_requirements_marker()
+        return True
+    
     print("🔧 Installing required packages...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements_advanced.txt"])
+        # Hand pip just the missing packages when the preflight could tell which they are
+        targets = unmet if unmet else ["-r", REQUIREMENTS_FILE]
+        run_pip_install(*targets, in_process=in_process_pip)
         print("✅ Packages installed successfully!")
+        save_requirements_marker()
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Error installing packages: {e}")
         print("💡 Try installing manually with: pip install streamlit pandas matplotlib seaborn plotly")
+        print("💡 For much faster installs, bootstrap uv once with: pip install uv")
         return False
-    except FileNotFoundError:
-        print("⚠️ requirements_advanced.txt not found, installing core packages...")
+
+def find_streamlit():
+    """Locate this environment's streamlit executable, caching the lookup across runs"""
+    # Keyed by interpreter so a different venv or Python version never reuses a stale path
+    key = f"{sys.prefix}|{sys.version}"
+    try:
+        paths = json.loads(PATHS_CACHE.read_text())
+    except (OSError, ValueError):
+        paths = {}
+    if not isinstance(paths, dict):
+        paths = {}
+    
+    cached = paths.get(key)
+    if cached and os.access(cached, os.X_OK):
+        return cached
+    
+    # Only this interpreter's scripts directory; a streamlit elsewhere on PATH may
+    # belong to another environment
+    found = shutil.which("streamlit", path=sysconfig.get_path("scripts"))
+    if found:
+        paths[key] = found
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", 
-                                 "streamlit", "pandas", "matplotlib", "seaborn", "plotly", "scipy", "scikit-learn"])
-            print("✅ Core packages installed!")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Error installing core packages: {e}")
-            return False
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            PATHS_CACHE.write_text(json.dumps(paths))
+        except OSError:
+            pass
+    return found
 
-def launch_dashboard():
+def launch_dashboard(headless=False):
     """Launch the Streamlit dashboard"""
     print("🚀 Launching Airline Analytics Dashboard...")
+    # The console script skips resolving the streamlit package through runpy
+    streamlit_bin = find_streamlit()
+    if streamlit_bin:
+        command = [streamlit_bin, "run", DASHBOARD_FILE]
+    else:
+        command = [sys.executable, "-m", "streamlit", "run", DASHBOARD_FILE]
+    if headless:
+        # No browser to open in CI; serve on $PORT like hosted platforms expect
+        command += ["--server.headless=true", f"--server.port={os.environ.get('PORT', '8501')}"]
+    
+    # Replace the launcher process with Streamlit rather than waiting on a child;
+    # Streamlit handles Ctrl+C itself, and exec only returns if the launch failed
+    sys.stdout.flush()
     try:
-        subprocess.run([sys.executable, "-m", "streamlit", "run", "advanced_airline_dashboard.py"])
-    except KeyboardInterrupt:
-        print("\n👋 Dashboard stopped by user")
-    except Exception as e:
+        os.execv(command[0], command)
+    except OSError as e:
         print(f"❌ Error launching dashboard: {e}")
 
-def main():
+def parse_args(argv=None):
+    """Parse launcher command-line options"""
+    parser = argparse.ArgumentParser(description="Launch the airline analytics dashboard")
+    parser.add_argument("-y", "--yes", action="store_true",
+                        help="don't prompt; install/update packages and launch")
+    parser.add_argument("--skip-install", action="store_true",
+                        help="don't install/update packages")
+    parser.add_argument("--in-process-pip", action="store_true",
+                        help="run pip inside the launcher instead of a subprocess, bypassing uv (faster, less isolated)")
+    parser.add_argument("--no-prompt", action="store_true",
+                        help="run unattended: install/update packages and launch headless (default under CI)")
+    args = parser.parse_args(argv)
+    
+    # CI runs (and --no-prompt) execute the full default path without a browser
+    args.headless = args.no_prompt or bool(os.environ.get("CI") or os.environ.get("GITHUB_ACTIONS"))
+    args.install_auto_skipped = False
+    if args.headless:
+        args.yes = True
+    # Otherwise nobody can answer a prompt without a terminal; unless the flags
+    # already chose whether to install, take the fast path and skip it
+    elif not sys.stdin.isatty():
+        if not (args.yes or args.skip_install):
+            args.skip_install = args.install_auto_skipped = True
+        args.yes = True
+    return args
+
+def main(argv=None):
     """Main launcher function"""
+    args = parse_args(argv)
     print("✈️ Airline Experience Analytics Dashboard Launcher")
     print("=" * 50)
     
     # Check if data file exists
-    if not check_file_exists("Airline Review.csv"):
+    if not check_file_exists(DATA_FILE):
         print("\n📋 Next steps:")
         print("1. Place 'Airline Review.csv' in this directory")
         print("2. Run this launcher again")
         return
     
     # Check if dashboard file exists
-    if not check_file_exists("advanced_airline_dashboard.py"):
+    if not check_file_exists(DASHBOARD_FILE):
         print("❌ Dashboard file not found!")
         return
     
     print("✅ Data file found!")
     
-    # Ask if user wants to install requirements
-    install_deps = input("\n🔧 Install/update required packages? (y/n): ").lower().strip()
-    if install_deps in ['y', 'yes']:
-        if not install_requirements():
-            print("⚠️ Continuing without package installation...")
+    # Count the reviews in the background while the user answers and pip runs
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        review_count = pool.submit(check_csv_rows)
+        
+        # One prompt covers both steps (default yes); --yes skips it
+        if args.yes:
+            proceed = True
+        else:
+            action = "Launch dashboard" if args.skip_install else "Install/update required packages and launch dashboard"
+            proceed = input(f"\n🚀 {action}? [Y/n]: ").lower().strip() in ['', 'y', 'yes']
+        
+        if proceed and not args.skip_install:
+            if not install_requirements(in_process_pip=args.in_process_pip):
+                print("⚠️ Continuing without package installation...")
+        elif args.install_auto_skipped:
+            print("ℹ️ No terminal attached, skipping package installation (pass --yes to install)")
+        
+        rows = review_count.result()
     
     # Launch dashboard
-    print(f"\n📊 Found {check_csv_rows()} reviews in dataset")
-    launch_input = input("🚀 Launch dashboard? (y/n): ").lower().strip()
-    if launch_input in ['y', 'yes']:
-        launch_dashboard()
+    print(f"\n📊 Found {rows} reviews in dataset")
+    if proceed:
+        launch_dashboard(headless=args.headless)
     else:
         print("👋 Dashboard launch cancelled")
 
 def check_csv_rows():
     """Quick check of CSV file size"""
+    # pandas is deliberately not imported here: the launcher must start quickly and
+    # work before install_requirements() has run, so rows are counted from the bytes.
+    # Reviews contain quoted line breaks, so only newlines outside quotes are counted.
+    info = stat_file(DATA_FILE)
+    if info is None:
+        return "unknown number of"
+    
+    # Small files are read in one go; larger ones in 1 MiB chunks. Huge files only
+    # have their first chunk counted, since the number is just shown at launch.
+    # (mmap was measured slower: it has no count(), so skipping quoted fields needs a
+    # Python-level find() loop, and slicing the map copies just like read() does.)
+    chunk_size = max(min(info.st_size, ROW_SAMPLE_BYTES), 1)
+    estimate = info.st_size > ROW_ESTIMATE_THRESHOLD
     try:
-        import pandas as pd
-        df = pd.read_csv("Airline Review.csv")
-        return len(df)
-    except:
+        rows = 0
+        in_quotes = False
+        last_byte = b"\n"
+        with open(DATA_FILE, "rb", buffering=chunk_size) as f:
+            while chunk := f.read(chunk_size):
+                parts = chunk.split(b'"')
+                rows += sum(part.count(b"\n") for part in parts[in_quotes::2])
+                if len(parts) % 2 == 0:
+                    in_quotes = not in_quotes
+                last_byte = chunk[-1:]
+                if estimate:
+                    return f"~{max(rows * info.st_size // len(chunk) - 1, 0):,}"
+        if last_byte != b"\n":
+            rows += 1
+        return max(rows - 1, 0)
+    except OSError:
         return "unknown number of"
 
 if __name__ == "__main__":